@@ -1,5 +1,4 @@
-use std::fs::File;
-use std::io::Write;
+use std::fmt::Write;
 use std::path::Path;
 
 use anyhow::Result;
@@ -10,6 +9,13 @@ pub const DAY_GOD_HEADER: &str = r#"//! 此文件由 build.rs 自动生成，不
 mod original_strings;
 use original_strings::DAY_GODS;
 
+/// 将两个十六进制 ASCII 字符解码为一个字节
+fn decode_hex_pair(pair: &[u8]) -> Option<u8> {
+    let hi = (pair[0] as char).to_digit(16)?;
+    let lo = (pair[1] as char).to_digit(16)?;
+    Some((hi << 4 | lo) as u8)
+}
+
 pub fn generate_day_god_data() -> Result<()> {
     // 生成 Rust 代码
     let mut content = format!("{}\n", DAY_GOD_HEADER);
@@ -18,44 +24,35 @@ pub fn generate_day_god_data() -> Result<()> {
     content.push_str("pub static DAY_GODS_TABLE: [[Option<&[u8]>; 60]; 12] = [\n");
 
     for month_data in DAY_GODS.iter() {
-        content.push_str("    [\n");
-
-        let mut day_entries: [Option<&'static [u8]>; 60] = [None; 60];
+        // 先把每个分段解析到对应的天，再按天的顺序输出
+        let mut day_entries: [Option<Vec<u8>>; 60] = [const { None }; 60];
 
         for segment in month_data.split(';') {
-            if segment.len() >= 2 {
-                if let Ok(day_index) = u8::from_str_radix(&segment[0..2], 16) {
-                    if day_index < 60 {
-                        let data_str = &segment[2..];
-                        // 生成静态数组
-                        let data_vec: Vec<u8> = data_str
-                            .as_bytes()
-                            .chunks(2)
-                            .filter_map(|chunk| {
-                                if chunk.len() == 2 {
-                                    std::str::from_utf8(chunk)
-                                        .ok()
-                                        .and_then(|s| u8::from_str_radix(s, 16).ok())
-                                } else {
-                                    None
-                                }
-                            })
-                            .collect();
+            // 每段前两个十六进制字符为天的序号，其余为数据
+            let Some((day_hex, data_hex)) = segment.as_bytes().split_at_checked(2) else {
+                continue;
+            };
+            let Some(day_index) = decode_hex_pair(day_hex).filter(|&day| day < 60) else {
+                continue;
+            };
+
+            // 生成静态数组
+            let data_vec: Vec<u8> = data_hex
+                .chunks_exact(2)
+                .filter_map(decode_hex_pair)
+                .collect();
 
-                        if !data_vec.is_empty() {
-                            content.push_str(&format!("        Some(&{:?}),\n", data_vec));
-                            day_entries[day_index as usize] =
-                                Some(Box::leak(data_vec.into_boxed_slice()));
-                        }
-                    }
-                }
+            if !data_vec.is_empty() {
+                day_entries[day_index as usize] = Some(data_vec);
             }
         }
 
-        // 对于没有数据的天，写入 None
-        for day_idx in 0..60 {
-            if day_entries[day_idx].is_none() {
-                content.push_str(&format!("        None, // 天 {}\n", day_idx));
+        content.push_str("    [\n");
+        for (day_idx, entry) in day_entries.iter().enumerate() {
+            match entry {
+                Some(data_vec) => writeln!(content, "        Some(&{:?}),", data_vec)?,
+                // 对于没有数据的天，写入 None
+                None => writeln!(content, "        None, // 天 {}", day_idx)?,
             }
         }
 
@@ -69,8 +66,7 @@ pub fn generate_day_god_data() -> Result<()> {
         .join("generated_day_god_data.rs");
 
     // 写入文件
-    let mut f = File::create(&dest_path).unwrap();
-    writeln!(f, "{}", content)?;
+    super::write_generated(&dest_path, content)?;
 
     Ok(())
 }
@@ -1,5 +1,4 @@
-use std::fs::File;
-use std::io::Write;
+use std::fmt::Write;
 use std::path::Path;
 
 use anyhow::Result;
@@ -24,10 +23,11 @@ pub fn generate_holidays_data() -> Result<()> {
     let mut content = format!("{}\n\n", HOLIDAYS_HEADER);
 
     let record_count = LEGAL_HOLIDAY_DATA.len() / 13;
-    content.push_str(&format!(
-        "pub const LEGAL_HOLIDAY_TABLE: [LegalHolidayEntry; {}] = [\n",
+    writeln!(
+        content,
+        "pub const LEGAL_HOLIDAY_TABLE: [LegalHolidayEntry; {}] = [",
         record_count
-    ));
+    )?;
 
     for i in 0..record_count {
         let start = i * 13;
@@ -42,10 +42,11 @@ pub fn generate_holidays_data() -> Result<()> {
         let work = work_char == "0";
         let index = index_char.parse::<u8>().unwrap();
 
-        content.push_str(&format!(
-            "    LegalHolidayEntry {{ year: {}, month: {}, day: {}, work: {}, index: {} }},\n",
+        writeln!(
+            content,
+            "    LegalHolidayEntry {{ year: {}, month: {}, day: {}, work: {}, index: {} }},",
             year, month, day, work, index
-        ));
+        )?;
     }
 
     content.push_str("];\n");
@@ -53,8 +54,7 @@ pub fn generate_holidays_data() -> Result<()> {
     let dest_path = Path::new("src").join("generated_holidays_data.rs");
 
     // 写入文件
-    let mut f = File::create(&dest_path).unwrap();
-    writeln!(f, "{}", content)?;
+    super::write_generated(&dest_path, content)?;
 
     Ok(())
 }
@@ -1,5 +1,4 @@
-use std::fs::File;
-use std::io::Write;
+use std::fmt::Write;
 use std::path::Path;
 
 use anyhow::Result;
@@ -10,6 +9,18 @@ pub const LEAP_YEAR_HEADER: &str = r#"//! 此文件由 build.rs 自动生成，
 mod original_leap_month_strings;
 use original_leap_month_strings::{CHARS, LEAP_MONTH};
 
+/// CHARS 的反查表，按字节值索引得到该字符在 CHARS 中的位置；编译期生成
+const CHAR_VALUES: [Option<u8>; 256] = {
+    let chars = CHARS.as_bytes();
+    let mut table = [None; 256];
+    let mut i = 0;
+    while i < chars.len() {
+        table[chars[i] as usize] = Some(i as u8);
+        i += 1;
+    }
+    table
+};
+
 pub fn generate_leap_year_data() -> Result<()> {
     let mut leap_month_data = Vec::new();
     let mut max_days_in_month = 0;
@@ -24,13 +35,10 @@ pub fn generate_leap_year_data() -> Result<()> {
             month_str
         );
 
-        for i in (0..month_str.len()).step_by(2) {
-            let s = &month_str[i..i + 2];
-            let c1 = s.chars().next().unwrap();
-            let c2 = s.chars().nth(1).unwrap();
-
-            let val1 = CHARS.find(c1).unwrap() as isize;
-            let val2 = CHARS.find(c2).unwrap() as isize;
+        // 编码字符均为 ASCII，直接按字节两两读取
+        for pair in month_str.as_bytes().chunks_exact(2) {
+            let val1 = CHAR_VALUES[pair[0] as usize].unwrap() as isize;
+            let val2 = CHAR_VALUES[pair[1] as usize].unwrap() as isize;
 
             let t = val1 * 64 + val2;
             n += t;
@@ -50,15 +58,14 @@ pub fn generate_leap_year_data() -> Result<()> {
     content.push_str("#[rustfmt::skip]\n");
     content.push_str("pub static LEAP_MONTH_YEAR_DATA: &[&[isize]] = &[\n");
     for month_values in &leap_month_data {
-        content.push_str(&format!("    &{:?},\n", month_values));
+        writeln!(content, "    &{:?},", month_values)?;
     }
     content.push_str("];\n");
 
     let dest_path = Path::new("src").join("generated_leap_year_data.rs");
 
     // 写入文件
-    let mut f = File::create(&dest_path).unwrap();
-    writeln!(f, "{}", content)?;
+    super::write_generated(&dest_path, content)?;
 
     Ok(())
 }
@@ -1,3 +1,8 @@
+use std::fs;
+use std::path::Path;
+
+use anyhow::Result;
+
 #[cfg(feature = "god")]
 pub mod day_god;
 #[cfg(feature = "holiday")]
@@ -6,3 +11,20 @@ pub mod leap_month;
 pub mod qishuo;
 #[cfg(feature = "rabbyung")]
 pub mod rab_byung_month_days;
+
+/// 写入生成的代码文件
+///
+/// 内容与磁盘上已有文件一致时跳过写入，避免修改文件时间戳而触发整个库重新编译
+pub fn write_generated(dest_path: &Path, mut content: String) -> Result<()> {
+    content.push('\n');
+
+    let unchanged = fs::read(dest_path).is_ok_and(|existing| existing == content.as_bytes());
+    if unchanged {
+        return Ok(());
+    }
+
+    // 整个文件一次性写出
+    fs::write(dest_path, content)?;
+
+    Ok(())
+}
@@ -1,5 +1,3 @@
-use std::fs::File;
-use std::io::Write;
 use std::path::Path;
 
 use anyhow::Result;
@@ -13,88 +11,107 @@ pub const QISHUO_HEADER: &str = r#"// 自动生成的压缩数据 - 请勿手动
 // 每个字符用2位存储: 00=0, 01=1, 10=2"#;
 
 pub const GET_SHUO_FUNCTION: &str = r#"/// 从2位压缩数据中获取指定索引的值 (0, 1, 或 2)
+#[inline]
 pub fn get_shuo_value(index: usize) -> u8 {
     if index >= SHUO_LEN {
         return 0;
     }
 
-    let byte_index = index / 4; // 每字节存储4个值
-    let bit_offset = (index % 4) * 2; // 每个值占2位
-    let shift = 6 - bit_offset; // 大端序，第一个值在最高2位
+    let byte = SHUO_BYTES[index >> 2]; // 每字节存储4个值
+    let shift = 6 - ((index & 0b11) << 1); // 每个值占2位，大端序，第一个值在最高2位
 
-    ((SHUO_BYTES[byte_index] >> shift) & 0b11) as u8
+    (byte >> shift) & 0b11
 }"#;
 
 pub const GET_QI_FUNCTION: &str = r#"/// 从2位压缩数据中获取指定索引的值 (0, 1, 或 2)
+#[inline]
 pub fn get_qi_value(index: usize) -> u8 {
     if index >= QI_LEN {
         return 0;
     }
 
-    let byte_index = index / 4; // 每字节存储4个值
-    let bit_offset = (index % 4) * 2; // 每个值占2位
-    let shift = 6 - bit_offset; // 大端序，第一个值在最高2位
+    let byte = QI_BYTES[index >> 2]; // 每字节存储4个值
+    let shift = 6 - ((index & 0b11) << 1); // 每个值占2位，大端序，第一个值在最高2位
 
-    ((QI_BYTES[byte_index] >> shift) & 0b11) as u8
+    (byte >> shift) & 0b11
 }"#;
 
-fn jieya(s: &str) -> String {
-    let o = "0000000000";
-    let o2 = format!("{o}{o}");
-
-    let mut result = s.to_string();
-
-    let replacements = [
-        ("J", "00"),
-        ("I", "000"),
-        ("H", "0000"),
-        ("G", "00000"),
-        ("t", "02"),
-        ("s", "002"),
-        ("r", "0002"),
-        ("q", "00002"),
-        ("p", "000002"),
-        ("o", "0000002"),
-        ("n", "00000002"),
-        ("m", "000000002"),
-        ("l", "0000000002"),
-        ("k", "01"),
-        ("j", "0101"),
-        ("i", "001"),
-        ("h", "001001"),
-        ("g", "0001"),
-        ("f", "00001"),
-        ("e", "000001"),
-        ("d", "0000001"),
-        ("c", "00000001"),
-        ("b", "000000001"),
-        ("a", "0000000001"),
-        ("A", &format!("{o2}{o2}{o2}")),
-        ("B", &format!("{o2}{o2}{o}")),
-        ("C", &format!("{o2}{o2}")),
-        ("D", &format!("{o2}{o}")),
-        ("E", &o2),
-        ("F", o),
-    ];
-
-    for (from, to) in replacements.iter() {
-        result = result.replace(from, to);
+/// 压缩字符及其展开内容，展开结果只含 '0'/'1'/'2'
+const REPLACEMENTS: [(u8, &[u8]); 30] = [
+    (b'J', b"00"),
+    (b'I', b"000"),
+    (b'H', b"0000"),
+    (b'G', b"00000"),
+    (b't', b"02"),
+    (b's', b"002"),
+    (b'r', b"0002"),
+    (b'q', b"00002"),
+    (b'p', b"000002"),
+    (b'o', b"0000002"),
+    (b'n', b"00000002"),
+    (b'm', b"000000002"),
+    (b'l', b"0000000002"),
+    (b'k', b"01"),
+    (b'j', b"0101"),
+    (b'i', b"001"),
+    (b'h', b"001001"),
+    (b'g', b"0001"),
+    (b'f', b"00001"),
+    (b'e', b"000001"),
+    (b'd', b"0000001"),
+    (b'c', b"00000001"),
+    (b'b', b"000000001"),
+    (b'a', b"0000000001"),
+    (b'A', &[b'0'; 60]),
+    (b'B', &[b'0'; 50]),
+    (b'C', &[b'0'; 40]),
+    (b'D', &[b'0'; 30]),
+    (b'E', &[b'0'; 20]),
+    (b'F', &[b'0'; 10]),
+];
+
+/// 按字节值索引的展开表，None 表示原样保留；编译期生成
+const EXPANSION_TABLE: [Option<&[u8]>; 256] = {
+    let mut table: [Option<&[u8]>; 256] = [None; 256];
+    let mut i = 0;
+    while i < REPLACEMENTS.len() {
+        let (from, to) = REPLACEMENTS[i];
+        table[from as usize] = Some(to);
+        i += 1;
     }
+    table
+};
+
+/// 逐字节展开压缩数据，以迭代器形式产出，不生成完整的解压字符串
+fn jieya(s: &str) -> impl Iterator<Item = u8> + '_ {
+    s.bytes().flat_map(|b| {
+        let (expanded, raw) = match EXPANSION_TABLE[b as usize] {
+            Some(to) => (to, None),
+            None => (&[][..], Some(b)),
+        };
+        expanded.iter().copied().chain(raw)
+    })
+}
 
-    result
+/// 计算压缩数据展开后的长度
+fn jieya_len(s: &str) -> usize {
+    s.bytes()
+        .map(|b| EXPANSION_TABLE[b as usize].map_or(1, <[u8]>::len))
+        .sum()
 }
 
-fn string_to_two_bits(s: &str) -> (Vec<u8>, usize) {
-    let mut bytes = Vec::new();
+fn string_to_two_bits(s: impl Iterator<Item = u8>, len: usize) -> Vec<u8> {
+    // 展开长度已知，一次分配好打包后的缓冲区
+    let mut bytes = Vec::with_capacity(len.div_ceil(4));
     let mut current_byte = 0u8;
     let mut bit_count = 0;
 
-    for ch in s.chars() {
-        let value = match ch {
-            '0' => 0b00, // 00 = 0
-            '1' => 0b01, // 01 = 1
-            '2' => 0b10, // 10 = 2
-            _ => 0b00,   // 默认处理为0
+    for b in s {
+        let value = match b {
+            b'0' => 0b00, // 00 = 0
+            b'1' => 0b01, // 01 = 1
+            b'2' => 0b10, // 10 = 2
+            _ => 0b00,    // 默认处理为0
         };
 
         // 将2位值放入当前字节
@@ -114,17 +131,19 @@ fn string_to_two_bits(s: &str) -> (Vec<u8>, usize) {
         bytes.push(current_byte);
     }
 
-    (bytes, s.len())
+    debug_assert_eq!(bytes.len(), len.div_ceil(4));
+
+    bytes
 }
 
 pub fn generate_qishuo_data() -> Result<()> {
     // 处理朔日表
-    let shuo_decompressed = jieya(SHUO_S);
-    let (shuo_bytes, shuo_len) = string_to_two_bits(&shuo_decompressed);
+    let shuo_len = jieya_len(SHUO_S);
+    let shuo_bytes = string_to_two_bits(jieya(SHUO_S), shuo_len);
 
     // 处理节气表
-    let qi_decompressed = jieya(QI_S);
-    let (qi_bytes, qi_len) = string_to_two_bits(&qi_decompressed);
+    let qi_len = jieya_len(QI_S);
+    let qi_bytes = string_to_two_bits(jieya(QI_S), qi_len);
 
     // 生成 Rust 代码
     let content = format!(
@@ -137,8 +156,7 @@ pub fn generate_qishuo_data() -> Result<()> {
         .join("generated_compressed_qishuo_correction_data.rs");
 
     // 写入文件
-    let mut f = File::create(&dest_path).unwrap();
-    writeln!(&mut f, "{}", content)?;
+    super::write_generated(&dest_path, content)?;
 
     Ok(())
 }
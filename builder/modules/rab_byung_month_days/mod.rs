@@ -1,6 +1,5 @@
 // build.rs
-use std::fs::File;
-use std::io::Write;
+use std::fmt::Write;
 use std::path::Path;
 
 use anyhow::Result;
@@ -33,34 +32,33 @@ pub fn generate_rab_byung_data() -> Result<()> {
     content.push_str("#[rustfmt::skip]\n");
     content.push_str("pub static RAB_BYUNG_DATA: &[RabByungMonthData] = &[\n");
 
-    let years: Vec<&str> = RAW_DATA.split(',').collect();
     let mut y: usize = 1950;
     let mut m: usize = 11;
 
-    for s in years {
-        let mut ys = s;
-        while !ys.is_empty() {
-            let mut chars = ys.chars();
-            let len_char = chars.next().unwrap();
-            let len = (len_char as usize) - ('0' as usize);
+    // 直接遍历各年的分段，无需先收集成 Vec
+    for s in RAW_DATA.split(',') {
+        // 数据均为 ASCII，按字节切片：首字节为天数，随后每字节对应一天
+        let mut ys = s.as_bytes();
+        while let Some((&len_byte, rest)) = ys.split_first() {
+            let len = (len_byte - b'0') as usize;
+            assert!(rest.len() >= len, "RabByung data truncated: {}", s);
+            let (days, rest) = rest.split_at(len);
 
-            let mut days_array = Vec::new();
-            for _ in 0..len {
-                if let Some(ch) = chars.next() {
-                    let day_value = ch as isize - '5' as isize - 30;
-                    days_array.push(day_value);
-                }
-            }
+            let days_array: Vec<isize> = days
+                .iter()
+                .map(|&b| b as isize - b'5' as isize - 30)
+                .collect();
 
             // 生成静态数组条目
-            content.push_str(&format!(
-                "    RabByungMonthData {{ year: {}, month: {}, days: &{:?} }},\n",
+            writeln!(
+                content,
+                "    RabByungMonthData {{ year: {}, month: {}, days: &{:?} }},",
                 y, m, days_array
-            ));
+            )?;
 
             // 更新位置
             m += 1;
-            ys = chars.as_str();
+            ys = rest;
         }
         y += 1;
         m = 0;
@@ -72,8 +70,7 @@ pub fn generate_rab_byung_data() -> Result<()> {
     let dest_path = Path::new("src").join("generated_rab_byung.rs");
 
     // 写入文件
-    let mut f = File::create(&dest_path).unwrap();
-    writeln!(f, "{}", content)?;
+    super::write_generated(&dest_path, content)?;
 
     Ok(())
 }